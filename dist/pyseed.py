@@ -32,26 +32,27 @@ if sys.version_info < (3, NEED_PYTHON_MINOR_VERSION):
 import json
 import os
 import re
-import shutil
-import stat
 import subprocess
-import textwrap
 from abc import ABC, abstractmethod
 from argparse import ArgumentParser
 from contextlib import contextmanager
 from enum import Enum
-from getpass import getpass
+from itertools import chain
 from pathlib import Path
 from subprocess import CalledProcessError, CompletedProcess
-from typing import Any, Callable, Optional, Union
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
+from urllib.parse import unquote, urlparse
+
+if TYPE_CHECKING:
+    import http.client
+    from concurrent.futures import Future
 
 ########################################################################
 # GLOBAL VARIABLES
 
 
 verbose = True
-pwd_abs = Path(os.curdir).absolute()
+pwd_abs = Path.cwd()
 ensure_tty = False
 
 
@@ -59,15 +60,29 @@ ensure_tty = False
 # VERBOSITY SENSITIVE VERSIONS OF COMMON FUNCTIONS
 
 
-def vprint(*args, **kwargs):
+def vprint(*args, sep: str = " ", end: str = "\n", file=None):
+    # Output is written directly to the file, instead of through `print`,
+    # since this is called for every file written and command run.
     if verbose:
-        print(*args, **kwargs)
+        if file is None:
+            file = sys.stdout
+        file.write(sep.join(map(str, args)) + end)
+
 
+def encode_file_text(text: str) -> bytes:
+    # Text is stripped, terminated with a single newline, and encoded as
+    # UTF-8. Since files are written in binary mode, they always have LF
+    # line endings (as required by the generated '.editorconfig').
+    return (text.strip() + "\n").encode("utf-8")
 
-def vwritetext(path, text, *args, **kwargs):
+
+def vwritebytes(path, data):
     vprint(f"+ WRITE {path}", file=sys.stderr)
-    text = text.strip() + "\n"
-    path.write_text(text, *args, **kwargs)
+    path.write_bytes(data)
+
+
+def vwritetext(path, text):
+    vwritebytes(path, encode_file_text(text))
 
 
 def vtouch(path, *args, **kwargs):
@@ -75,9 +90,14 @@ def vtouch(path, *args, **kwargs):
     path.touch(*args, **kwargs)
 
 
+def vmkdir(path, *args, **kwargs):
+    vprint(f"+ MKDIR {path}", file=sys.stderr)
+    path.mkdir(*args, **kwargs)
+
+
 def vrun(cmd: list[str], *args, **kwargs) -> CompletedProcess:
-    vprint(f"\n+ RUN {shlex.join(cmd)}", file=sys.stderr)
-    show_output_on_err = False
+    if verbose:  # avoid quoting the command if it will not be printed
+        print(f"\n+ RUN {shlex.join(cmd)}", file=sys.stderr)
     if "check" not in kwargs:
         kwargs["check"] = True
     if "text" not in kwargs:
@@ -85,15 +105,26 @@ def vrun(cmd: list[str], *args, **kwargs) -> CompletedProcess:
     if not verbose and not any(
         _k in kwargs for _k in ["capture_output", "stdout", "stderr"]
     ):
-        show_output_on_err = True
-        kwargs["stdout"] = subprocess.PIPE
-        kwargs["stderr"] = subprocess.STDOUT
+        # Output is only shown if the command fails. So it is written to a
+        # temporary file, instead of being read into memory through a pipe.
+        # 'tempfile' loads several other modules, so it is imported here to
+        # avoid slowing down startup.
+        from tempfile import TemporaryFile
+
+        with TemporaryFile() as output_file:
+            kwargs["stdout"] = output_file
+            kwargs["stderr"] = subprocess.STDOUT
+            try:
+                return subprocess.run(cmd, *args, **kwargs)  # noqa: PLW1510
+            except CalledProcessError:
+                output_file.seek(0)
+                output = output_file.read().decode("utf-8", errors="replace")
+                print(output, file=sys.stderr)
+                raise
     try:
         return subprocess.run(cmd, *args, **kwargs)  # noqa: PLW1510
     except CalledProcessError as e:
-        if show_output_on_err:
-            print(e.stdout, file=sys.stderr)
-        elif kwargs.get("capture_output"):
+        if kwargs.get("capture_output"):
             print(e.stderr, file=sys.stderr)
         raise
 
@@ -103,26 +134,36 @@ def vrun(cmd: list[str], *args, **kwargs) -> CompletedProcess:
 
 
 def get_git_user() -> Optional[str]:  # output is formatted as 'name <email>'
+    # Both keys are read with a single call to `git config`, which
+    # outputs lines of the form 'user.<key> <value>'. If a key is set in
+    # multiple places, later lines take precedence (same as git).
+    try:
+        proc = subprocess.run(
+            ["git", "config", "--get-regexp", r"^user\.(name|email)$"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except CalledProcessError:
+        return None
+
     user_data = {}
-    for key in ["name", "email"]:
-        try:
-            proc = subprocess.run(
-                ["git", "config", f"user.{key}"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            user_data[key] = proc.stdout.strip()
-            if not user_data[key]:
-                return None
-        except CalledProcessError:
-            return None
-    return f"{user_data['name']} <{user_data['email']}>"
+    for line in proc.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        user_data[key] = value.strip()
+
+    name, email = user_data.get("user.name"), user_data.get("user.email")
+    if not name or not email:
+        return None
+    return f"{name} <{email}>"
+
+
+NAME_EMAIL_REGEX = re.compile(r"(.+) <.+>", flags=re.DOTALL)
 
 
 def extract_name_from_name_email(name_email: str) -> str:
     # 'My Name <my@email>' -> 'My Name'.
-    match = re.search(r"(.+) <.+>", name_email, flags=re.DOTALL)
+    match = NAME_EMAIL_REGEX.search(name_email)
     if match is not None:
         return match.groups()[0].strip()
     return name_email
@@ -131,23 +172,26 @@ def extract_name_from_name_email(name_email: str) -> str:
 ########################################################################
 # VALIDATION FUNCTIONS FOR CONFIG
 # Each of these functions takes a string, and returns a validation
-# error, or None if the input is valid.
+# error, or None if the input is valid. Inputs always come from `input`
+# or from the command line, so they are not checked to be strings.
 
 
 def validate_string_non_empty(inp: str) -> Optional[str]:
-    if not isinstance(inp, str):
-        return "not a string"
     if not inp:
         return "cannot be empty"
     return None
 
 
 def validate_string_python_version(inp: str) -> Optional[str]:
-    if not isinstance(inp, str):
-        return "not a string"
-    if re.match(r"3(\.[0-9]+){1,2}$", inp) is None:
+    # Valid versions are of the form '3.<minor>[.<patch>]'.
+    version_parts = inp.split(".")
+    if (
+        len(version_parts) not in [2, 3]
+        or version_parts[0] != "3"
+        or not all(part.isascii() and part.isdigit() for part in version_parts[1:])
+    ):
         return "not a valid python3 version"
-    minor_version = int(inp.split(".")[1])
+    minor_version = int(version_parts[1])
     if minor_version < NEED_PYTHON_MINOR_VERSION:
         return (
             f"can only create projects supporting python 3.{NEED_PYTHON_MINOR_VERSION}+"
@@ -156,8 +200,6 @@ def validate_string_python_version(inp: str) -> Optional[str]:
 
 
 def validate_string_url(inp: str) -> Optional[str]:
-    if not isinstance(inp, str):
-        return "not a string"
     # mkdocs needs urls to start with 'http[s]://'.
     parse_result = urlparse(inp)
     if parse_result.scheme not in ["http", "https"] or not parse_result.netloc:
@@ -165,6 +207,15 @@ def validate_string_url(inp: str) -> Optional[str]:
     return None
 
 
+YES_NO_INPUTS = ("y", "yes", "n", "no")
+
+
+def validate_string_yes_no(inp: str) -> Optional[str]:
+    if inp not in YES_NO_INPUTS:
+        return "enter [y]es/[n]o"
+    return None
+
+
 ########################################################################
 # FUNCTIONS FOR GETTING USER INPUT INTERACTIVELY
 # If the global `ensure_tty` is `True`, and `sys.stdin` is not a tty,
@@ -214,14 +265,9 @@ def get_input(
 
 
 def get_yes_no_input(prompt: str, default: Optional[bool] = None) -> bool:
-    def validate_yn(inp: str) -> Optional[str]:
-        if re.match(r"y|yes|n|no", inp) is None:
-            return "enter [y]es/[n]o"
-        return None
-
     prompt += " ([y]es/[n]o)"
     default_yn = None if default is None else ("yes" if default else "no")
-    raw_inp = get_input(prompt, default_yn, validate_yn)
+    raw_inp = get_input(prompt, default_yn, validate_string_yes_no)
     return raw_inp.startswith("y")
 
 
@@ -229,6 +275,30 @@ def get_yes_no_input(prompt: str, default: Optional[bool] = None) -> bool:
 # INTERFACE FOR MAKING CALLS TO THE GITHUB API
 
 
+# Script used for encrypting secrets, when `nacl` is not available on
+# the host. Values are inserted with `repr`, so they are always valid
+# Python string literals, even if they contain quotes.
+ENCRYPT_SECRET_SCRIPT_TEMPLATE = r"""
+from base64 import b64encode
+
+import nacl.public
+import nacl.encoding
+
+repo_public_key = {public_key!r}
+secret = {secret!r}
+
+repo_public_key_sealed_box = nacl.public.SealedBox(
+    nacl.public.PublicKey(
+        repo_public_key.encode("utf-8"), nacl.encoding.Base64Encoder()
+    )
+)
+secret_bytes = secret.encode("utf-8")
+secret_encrypted = repo_public_key_sealed_box.encrypt(secret_bytes)
+secret_encrypted_b64 = b64encode(secret_encrypted).decode("utf-8")
+print(secret_encrypted_b64)
+"""
+
+
 class GitHubAPI:
     class Error(Exception):
         def __init__(self, err: Union[Exception, str]):
@@ -238,8 +308,157 @@ class GitHubAPI:
                 errmsg = str(err)
             super().__init__(f"Error calling GitHub API: {errmsg}")
 
+    HOST = "api.github.com"
+    TIMEOUT = 60  # seconds
+    MAX_REDIRECTS = 5
+    MAX_RETRIES = 5
+    MAX_RETRY_DELAY = 60
+    # Calls with these methods can be safely repeated, if it is not known
+    # whether a previous attempt was processed.
+    IDEMPOTENT_METHODS = frozenset(["GET", "PUT", "DELETE"])
+
     def __init__(self, gh_token: str):
+        # Only needed for setting up GitHub, so imported here to avoid
+        # slowing down startup.
+        import threading
+
         self.gh_token = gh_token
+        self.headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "Authorization": f"Bearer {gh_token}",
+            "User-Agent": "shiny-pyseed",
+        }
+        # A single connection is kept open (per thread), and reused for all
+        # calls. So independent calls can be made concurrently from
+        # different threads.
+        self._thread_local = threading.local()
+        # Responses to GET calls are cached by endpoint. Any other call
+        # evicts cached responses for its endpoint, and for all parents
+        # and children of the endpoint.
+        self._get_cache: dict[str, dict[str, Any]] = {}
+
+    def _evict_cached(self, endpoint: str):
+        for cached_endpoint in list(self._get_cache):
+            if cached_endpoint.startswith(endpoint) or endpoint.startswith(
+                cached_endpoint
+            ):
+                self._get_cache.pop(cached_endpoint, None)
+
+    def _is_transient_error(
+        self, method: str, response: http.client.HTTPResponse
+    ) -> bool:
+        # Rate limited calls are not processed, so they can always be
+        # retried. Rate limit errors use status 429, or status 403 with no
+        # remaining requests. Server errors can happen after a call was
+        # processed, so they are only retried for idempotent calls.
+        if response.status == 403:
+            return response.getheader("X-RateLimit-Remaining") == "0"
+        if response.status == 429:
+            return True
+        if response.status in [500, 502, 503, 504]:
+            return method in self.IDEMPOTENT_METHODS
+        return False
+
+    def _get_retry_delay(self, response: http.client.HTTPResponse, retry: int) -> float:
+        import random
+
+        retry_after = response.getheader("Retry-After", "")
+        if retry_after.isdigit():
+            return min(self.MAX_RETRY_DELAY, int(retry_after))
+        return min(self.MAX_RETRY_DELAY, 2**retry) + random.uniform(0, 1)
+
+    def _new_connection(self) -> http.client.HTTPSConnection:
+        # Only needed for setting up GitHub, so imported here to avoid
+        # slowing down startup.
+        import http.client
+        import urllib.request
+        from base64 import b64encode
+
+        # Proxies are read from the environment (`https_proxy` and
+        # `no_proxy`), and used by tunneling through them. Note that
+        # certificates are verified with Python's default trust store, so on
+        # macOS with Python from python.org, the bundled 'Install
+        # Certificates' script must have been run.
+        proxy = urllib.request.getproxies().get("https")
+        if not proxy or urllib.request.proxy_bypass(self.HOST):
+            return http.client.HTTPSConnection(self.HOST, timeout=self.TIMEOUT)
+
+        proxy_url = urlparse(proxy if "://" in proxy else f"http://{proxy}")
+        conn = http.client.HTTPSConnection(
+            proxy_url.hostname or "", proxy_url.port or 80, timeout=self.TIMEOUT
+        )
+        tunnel_headers = {}
+        if proxy_url.username is not None:
+            proxy_auth = (
+                f"{unquote(proxy_url.username)}:{unquote(proxy_url.password or '')}"
+            )
+            tunnel_headers["Proxy-Authorization"] = (
+                f"Basic {b64encode(proxy_auth.encode()).decode()}"
+            )
+        conn.set_tunnel(self.HOST, 443, headers=tunnel_headers)
+        return conn
+
+    def _request(self, method: str, path: str, body: Optional[str]) -> bytes:
+        import http.client
+        import time
+
+        redirects, retries = 0, 0
+        while True:
+            # If the server closed a previously used connection, the
+            # request is retried once with a new connection. Non-idempotent
+            # calls are only retried if the request could not be sent, since
+            # otherwise it might have been processed.
+            conn: Optional[http.client.HTTPSConnection]
+            conn = getattr(self._thread_local, "conn", None)
+            conn_reused = conn is not None
+            if conn is None:
+                conn = self._new_connection()
+                self._thread_local.conn = conn
+            request_sent = False
+            try:
+                conn.request(method, path, body=body, headers=self.headers)
+                request_sent = True
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                conn.close()
+                self._thread_local.conn = None
+                if not conn_reused or (
+                    request_sent and method not in self.IDEMPOTENT_METHODS
+                ):
+                    raise
+                continue
+
+            response_data = response.read()
+            if response.status in [301, 302, 307, 308]:
+                if redirects == self.MAX_REDIRECTS:
+                    raise self.Error("too many redirects")
+                redirects += 1
+                location = urlparse(response.getheader("Location", ""))
+                if location.netloc != self.HOST:
+                    raise self.Error(f"unexpected redirect to '{location.geturl()}'")
+                path = location.path
+                if location.query:
+                    path += f"?{location.query}"
+                continue
+
+            # Rate limit and server errors are retried with exponential
+            # backoff (and random jitter), unless the server specifies a
+            # delay. Delays are capped, so a long 'Retry-After' does not
+            # stall the script.
+            if (
+                self._is_transient_error(method, response)
+                and retries < self.MAX_RETRIES
+            ):
+                retry_delay = self._get_retry_delay(response, retries)
+                vprint(
+                    f"+ RETRY in {retry_delay:.1f}s (status {response.status})",
+                    file=sys.stderr,
+                )
+                time.sleep(retry_delay)
+                retries += 1
+                continue
+            return response_data
 
     def call(
         self,
@@ -247,34 +466,44 @@ class GitHubAPI:
         call_type: Optional[str] = None,
         data: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        curl_cmd = ["curl", "-L"]
-        curl_cmd.extend(["-H", "Accept: application/vnd.github+json"])
-        curl_cmd.extend(["-H", "X-GitHub-Api-Version: 2022-11-28"])
-        curl_cmd.extend(["-H", f"Authorization: Bearer {self.gh_token}"])
+        import http.client
+
+        endpoint = endpoint.strip("/")
+        is_get = call_type is None and data is None
+        if is_get:
+            if endpoint in self._get_cache:
+                return self._get_cache[endpoint]
+        else:
+            self._evict_cached(endpoint)
+
         if call_type is not None:
-            curl_cmd.extend(["-X", call_type.upper()])
-        api_url = f"https://api.github.com/{endpoint}"
-        curl_cmd.append(api_url)
-        if data is not None:
-            curl_cmd.extend(["-d", json.dumps(data)])
-
-        vprint(f"\n+ CALL {api_url}", file=sys.stderr)
-        pdone = subprocess.run(curl_cmd, check=True, capture_output=True)
-        if not pdone.stdout:
+            method = call_type.upper()
+        else:
+            method = "GET" if data is None else "POST"
+        body = None if data is None else json.dumps(data)
+
+        vprint(f"\n+ CALL https://{self.HOST}/{endpoint}", file=sys.stderr)
+        try:
+            response_bytes = self._request(method, f"/{endpoint}", body)
+        except (OSError, http.client.HTTPException) as e:
+            raise self.Error(e) from None
+        if not response_bytes:
             return {}
         try:
-            response_data = json.loads(pdone.stdout)
+            response_data = json.loads(response_bytes)
         except json.JSONDecodeError as e:
             raise self.Error(e) from None
+        if is_get:
+            self._get_cache[endpoint] = response_data
         return response_data
 
     @contextmanager
     def setup_secrets_manager(self):
         # Uploading secrets to GitHub requires encrypting them with
-        # `libsodium`. Since this may not be available on the host
-        # system, encryption is done in the virtual environment
-        # created for the seeded project. `setup_secrets_manager`
-        # handles this as a context manager.
+        # `libsodium`. If `nacl` is available on the host system, it is
+        # used directly. Otherwise, encryption is done in the virtual
+        # environment created for the seeded project.
+        # `setup_secrets_manager` handles this as a context manager.
         secrets_manager = self.SecretsManager(self)
         secrets_manager._install_deps()
         try:
@@ -286,12 +515,32 @@ class GitHubAPI:
         def __init__(self, gh_api: GitHubAPI):
             self.gh_api = gh_api
             self.do_uninstall = False
+            self.host_has_nacl = self.can_import_nacl()
+
+        @staticmethod
+        def can_import_nacl() -> bool:
+            try:
+                import nacl.encoding
+                import nacl.public  # noqa: F401
+            except ImportError:
+                return False
+            return True
 
         def _install_deps(self):
-            vrun(["poetry", "run", "pip", "install", "--require-virtualenv", "pynacl"])
+            if not self.host_has_nacl:
+                vrun(
+                    [
+                        "poetry",
+                        "run",
+                        "pip",
+                        "install",
+                        "--require-virtualenv",
+                        "pynacl",
+                    ]
+                )
 
         def _uninstall_deps(self):
-            if self.do_uninstall:
+            if self.do_uninstall and not self.host_has_nacl:
                 vrun(
                     [
                         "poetry",
@@ -326,26 +575,22 @@ class GitHubAPI:
             )
 
         def encrypt(self, public_key: str, secret: str) -> str:
-            encrypt_script = textwrap.dedent(
-                f"""
+            if self.host_has_nacl:
                 from base64 import b64encode
 
-                import nacl.public
                 import nacl.encoding
+                import nacl.public
 
-                repo_public_key = "{public_key}"
-                secret = "{secret}"
-
-                repo_public_key_sealed_box = nacl.public.SealedBox(
+                public_key_sealed_box = nacl.public.SealedBox(
                     nacl.public.PublicKey(
-                        repo_public_key.encode("utf-8"), nacl.encoding.Base64Encoder()
+                        public_key.encode("utf-8"), nacl.encoding.Base64Encoder()
                     )
                 )
-                secret_bytes = secret.encode("utf-8")
-                secret_encrypted = repo_public_key_sealed_box.encrypt(secret_bytes)
-                secret_encrypted_b64 = b64encode(secret_encrypted).decode("utf-8")
-                print(secret_encrypted_b64)
-                """
+                secret_encrypted = public_key_sealed_box.encrypt(secret.encode("utf-8"))
+                return b64encode(secret_encrypted).decode("utf-8")
+
+            encrypt_script = ENCRYPT_SECRET_SCRIPT_TEMPLATE.format(
+                public_key=public_key, secret=secret
             )
 
             pdone = vrun(
@@ -382,11 +627,37 @@ class StrConfigKeySpec(ConfigKeySpec):
         description: str,
         default: Any = None,
         validator: Optional[Callable[[str], Optional[str]]] = None,
+        default_desc: Optional[str] = None,
     ):
         self.name = name
         self.description = description
-        self.default = default
+        self._default: Any = default
         self.validator = validator
+        # Shown in the help text in place of a lazy default, so that the
+        # default is not resolved just to build the argument parser.
+        self.default_desc = default_desc
+
+    @property
+    def default(self) -> Any:
+        # The default can be a function, which will be called (only
+        # once) when the default is first needed. This is used to avoid
+        # running expensive operations unless the default is used.
+        if callable(self._default):
+            self._default = self._default()
+        return self._default
+
+    @default.setter
+    def default(self, value: Any):
+        self._default = value
+
+    @property
+    def has_lazy_default(self) -> bool:
+        return callable(self._default)
+
+    @property
+    def arg_name(self) -> str:
+        name = self.name
+        return f"-{name}" if len(name) == 1 else f"--{name.replace('_', '-')}"
 
     def get_value_interactively(self) -> str:
         return get_input(
@@ -404,19 +675,25 @@ class StrConfigKeySpec(ConfigKeySpec):
                 return s
             raise ValueError(validation_error)
 
-        name = self.name
-        arg_name = f"-{name}" if len(name) == 1 else f"--{name.replace('_', '-')}"
-
         help_txt = self.description
-        if any(member.value is self for member in BAREBONES_MODE_IGNORED_CONFIG_KEYS):
+        if is_ignored_in_barebones_mode(self):
             help_txt += " (ignored in barebones mode)"
-        if self.default is not None:
-            help_txt += f" [default: '{self.default}']"
 
-        arg_default = None if no_default_required else self.default
-        arg_required = False if no_default_required else self.default is None
+        if self.has_lazy_default:
+            # Lazy defaults are resolved after parsing, and only if the
+            # argument is not given (see `parse_cmdline_args`).
+            if self.default_desc is not None:
+                help_txt += f" [default: {self.default_desc}]"
+            arg_default = None
+            arg_required = False
+        else:
+            if self.default is not None:
+                help_txt += f" [default: '{self.default}']"
+            arg_default = None if no_default_required else self.default
+            arg_required = False if no_default_required else self.default is None
+
         argparser.add_argument(
-            arg_name,
+            self.arg_name,
             type=add_type,
             help=help_txt,
             default=arg_default,
@@ -447,7 +724,7 @@ class BoolConfigKeySpec(ConfigKeySpec):
         #     are added to a mutually exclusive group.
         true_arg = f"--{self.name.replace('_', '-')}"
         help_txt = self.description
-        if any(member.value is self for member in BAREBONES_MODE_IGNORED_CONFIG_KEYS):
+        if is_ignored_in_barebones_mode(self):
             help_txt += " (ignored in barebones mode)"
         true_help = help_txt
         false_arg = f"--no-{self.name.replace('_', '-')}"
@@ -496,7 +773,10 @@ class ConfigKey(Enum):
     )
     add_mit_license = BoolConfigKeySpec("mit", "include mit license", True)
     authors = StrConfigKeySpec(
-        "authors", "authors (comma separated 'name <email>')", get_git_user()
+        "authors",
+        "authors (comma separated 'name <email>')",
+        get_git_user,
+        default_desc="from git config",
     )
     min_py_version = StrConfigKeySpec(
         "pym",
@@ -536,13 +816,25 @@ class ConfigKey(Enum):
     )
 
 
-BAREBONES_MODE_IGNORED_CONFIG_KEYS = [
-    ConfigKey.url,
-    ConfigKey.max_py_version,
-    ConfigKey.update_pc_hooks_on_schedule,
-    ConfigKey.no_github,
-    ConfigKey.no_doctests,
-]
+BAREBONES_MODE_IGNORED_CONFIG_KEYS = frozenset(
+    [
+        ConfigKey.url,
+        ConfigKey.max_py_version,
+        ConfigKey.update_pc_hooks_on_schedule,
+        ConfigKey.no_github,
+        ConfigKey.no_doctests,
+    ]
+)
+
+
+def is_ignored_in_barebones_mode(spec: ConfigKeySpec) -> bool:
+    # The spec's `ConfigKey` member is found by value, which is a dictionary
+    # lookup. Specs which are not part of `ConfigKey` are never ignored.
+    try:
+        config_key = ConfigKey(spec)
+    except ValueError:
+        return False
+    return config_key in BAREBONES_MODE_IGNORED_CONFIG_KEYS
 
 
 ########################################################################
@@ -564,19 +856,21 @@ def parse_cmdline_args() -> tuple[ConfigMode, Optional[dict[ConfigKey, Any]]]:
     if len(sys.argv) <= 1:
         return (ConfigMode.interactive, None)
 
-    config_mode = (
-        ConfigMode.interactive
-        if (
-            "--interactive" in sys.argv
-            or any(
-                # Single letter arguments can appear together:
-                # '-i', '-si', '-his' etc.
-                re.match(r"^-[a-z]*i[a-z]*$", arg) is not None
-                for arg in sys.argv
-            )
-        )
-        else ConfigMode.non_interactive
-    )
+    # The first element of `sys.argv` is the script name, and is skipped.
+    # Interactive mode is requested with '--interactive', or with a group
+    # of short flags containing 'i' (like '-i' or '-si').
+    config_mode = ConfigMode.non_interactive
+    for arg in sys.argv[1:]:
+        short_flags = arg[1:]
+        if arg == "--interactive" or (
+            arg.startswith("-")
+            and "i" in short_flags
+            and short_flags.isascii()
+            and short_flags.isalpha()
+            and short_flags.islower()
+        ):
+            config_mode = ConfigMode.interactive
+            break
 
     argparser = ArgumentParser()
     argparser.add_argument(
@@ -589,21 +883,49 @@ def parse_cmdline_args() -> tuple[ConfigMode, Optional[dict[ConfigKey, Any]]]:
         "-s", "--silent", help="suppress output", action="store_true"
     )
 
+    # Config keys are recorded by their argument destination as they are
+    # added, so they can be looked up directly from the parsed arguments.
+    config_keys_by_dest: dict[str, ConfigKey] = {}
     for config_key in ConfigKey:
         config_key.value.add_arg_to_argparser(
             argparser, no_default_required=config_mode == ConfigMode.interactive
         )
+        config_keys_by_dest[config_key.value.name] = config_key
 
     args = argparser.parse_args()
-    args_dict = vars(args)
+
+    # Lazy defaults were not given to the argument parser, so they are
+    # resolved here for arguments which were not given. In interactive
+    # mode, they are resolved when the value is prompted for.
+    if config_mode != ConfigMode.interactive:
+        for config_key in config_keys_by_dest.values():
+            spec = config_key.value
+            if not isinstance(spec, StrConfigKeySpec) or not spec.has_lazy_default:
+                continue
+            if getattr(args, spec.name) is not None:
+                continue
+            if spec.default is None:
+                argparser.error(
+                    f"the following arguments are required: {spec.arg_name}"
+                )
+            if spec.validator is not None:
+                validation_error = spec.validator(spec.default)
+                if validation_error is not None:
+                    argparser.error(f"argument {spec.arg_name}: {validation_error}")
+            setattr(args, spec.name, spec.default)
 
     if args.silent:
         global verbose  # noqa: PLW0603
         verbose = False
 
+    # The config is built in a single pass over the parsed arguments.
+    # Arguments which are not config keys ('interactive' and 'silent') are
+    # skipped.
     config: dict[ConfigKey, Any] = {}
-    for config_key in ConfigKey:
-        config_val = args_dict.get(config_key.value.name, None)
+    for arg_dest, config_val in vars(args).items():
+        if arg_dest not in config_keys_by_dest:
+            continue
+        config_key = config_keys_by_dest[arg_dest]
         # If in interactive mode, only read the config if present, to
         # set the default value.
         if config_mode != ConfigMode.interactive or config_val is not None:
@@ -612,6 +934,11 @@ def parse_cmdline_args() -> tuple[ConfigMode, Optional[dict[ConfigKey, Any]]]:
     return (config_mode, config)
 
 
+def get_default_main_pkg(project: str) -> str:
+    # 'path/to/my-project' -> 'my_project'.
+    return Path(project).stem.lower().replace("-", "_")
+
+
 def get_conf_interactively(
     base_config: Optional[dict[ConfigKey, Any]] = None,
 ) -> dict[ConfigKey, Any]:
@@ -626,8 +953,9 @@ def get_conf_interactively(
             config[config_key] = config_val
         try:
             if config_key == ConfigKey.project:
-                project_name = Path(config[ConfigKey.project]).stem
-                ConfigKey.main_pkg.value.default = project_name.replace("-", "_")
+                ConfigKey.main_pkg.value.default = get_default_main_pkg(
+                    config[ConfigKey.project]
+                )
         except AttributeError:
             continue
     return config
@@ -644,9 +972,7 @@ def get_conf() -> tuple[ConfigMode, dict[ConfigKey, Any]]:
 
     try:
         if not config[ConfigKey.main_pkg]:
-            config[ConfigKey.main_pkg] = (
-                Path(config[ConfigKey.project]).stem.lower().replace("-", "_")
-            )
+            config[ConfigKey.main_pkg] = get_default_main_pkg(config[ConfigKey.project])
     except AttributeError:
         pass
     return config_mode, config
@@ -658,6 +984,9 @@ def get_conf() -> tuple[ConfigMode, dict[ConfigKey, Any]]:
 # Template files are formatted with data from config.
 
 
+SCRIPT_FILE_MODE = 0o755  # rwxr-xr-x
+
+
 def init_project(config: dict[ConfigKey, Any]):
     authors = [
         author
@@ -669,30 +998,34 @@ def init_project(config: dict[ConfigKey, Any]):
 
     project_path = Path(config[ConfigKey.project])
     project_name = project_path.stem
+    main_pkg = config[ConfigKey.main_pkg]
+    barebones = config[ConfigKey.barebones]
+    add_mit_license = config[ConfigKey.add_mit_license]
+    description = config[ConfigKey.description]
+    min_py_version = config[ConfigKey.min_py_version]
     project_name_dump = json.dumps(project_name)
     project_path.mkdir(parents=True)
 
-    min_py_minor_ver = config[ConfigKey.min_py_version].split(".")[1]
+    min_py_minor_version = int(min_py_version.split(".")[1])
 
-    if config[ConfigKey.barebones]:
+    if barebones:
         pyproject = PYPROJECT_SIMPLE_TEMPLATE.format(
-            min_python_version=config[ConfigKey.min_py_version],
-            mypy_target_version=f"py3{min_py_minor_ver}",
+            min_python_version=min_py_version,
+            mypy_target_version=f"py3{min_py_minor_version}",
         )
     else:
         pyproject = PYPROJECT_TEMPLATE.format(
             name_dump=project_name_dump,
-            description_dump=json.dumps(config[ConfigKey.description]),
+            description_dump=json.dumps(description),
             authors_dump=json.dumps(authors),
-            license="MIT" if config[ConfigKey.add_mit_license] else "",
-            package=config[ConfigKey.main_pkg],
-            min_python_version=config[ConfigKey.min_py_version],
-            mypy_target_version=f"py3{min_py_minor_ver}",
+            license="MIT" if add_mit_license else "",
+            package=main_pkg,
+            min_python_version=min_py_version,
+            mypy_target_version=f"py3{min_py_minor_version}",
         )
     vwritetext(project_path / "pyproject.toml", pyproject)
 
-    if not config[ConfigKey.barebones]:
-        vprint(f"+ WRITE {project_path / 'mkdocs.yml'}", file=sys.stderr)
+    if not barebones:
         vwritetext(
             project_path / "mkdocs.yml",
             MKDOCS_CONFIG_TEMPLATE.format(
@@ -706,39 +1039,52 @@ def init_project(config: dict[ConfigKey, Any]):
 
     license_data = (
         MIT_LICENSE_TEMPLATE.format(author=comma_sep_author_names)
-        if config[ConfigKey.add_mit_license]
+        if add_mit_license
         else ""
     )
     vwritetext(project_path / "LICENSE.md", license_data)
 
-    readme = README_TEMPLATE.format(
-        title=project_name, description=config[ConfigKey.description]
-    ).strip()
+    readme = README_TEMPLATE.format(title=project_name, description=description)
+    vwritetext(project_path / "README.md", readme)
 
-    pre_commit_config = (
-        PRE_COMMIT_CONFIG_SIMPLE if config[ConfigKey.barebones] else PRE_COMMIT_CONFIG
-    )
+    if barebones:
+        for fpath, fdata in BAREBONES_PROJECT_FILES:
+            vwritebytes(project_path / fpath, fdata)
 
-    if config[ConfigKey.barebones]:
-        for fpath, fdata in [
-            ("README.md", readme),
-            (".cspell.json", CSPELL_CONFIG),
-            (".editorconfig", EDITORCONFIG),
-            (".gitignore", GITIGNORE),
-            (".pre-commit-config.yaml", pre_commit_config),
-        ]:
-            vwritetext(project_path / fpath, fdata)
-
-        main_pkg_dir = project_path / config[ConfigKey.main_pkg]
-        vprint(f"+ MKDIR {main_pkg_dir}", file=sys.stderr)
-        main_pkg_dir.mkdir(parents=True)
+        main_pkg_dir = project_path / main_pkg
+        vmkdir(main_pkg_dir)
         vtouch(main_pkg_dir / "__init__.py")
 
         vtouch(project_path / "project-words.txt")
         return
 
-    if not config[ConfigKey.no_github]:
-        min_py_minor_version = int(config[ConfigKey.min_py_version].split(".")[1])
+    # Keys ignored in barebones mode are only read after this point.
+    no_github = config[ConfigKey.no_github]
+
+    scripts_dir = Path("scripts")
+    main_pkg_dir = Path("src") / main_pkg
+    tests_dir = Path("tests")
+    www_dir = Path("www")
+    gh_workflows_dir = Path(".github") / "workflows"
+
+    # Directories are listed after their parents, so that each one can
+    # be created with a single `mkdir` call.
+    directories = [
+        scripts_dir,
+        main_pkg_dir.parent,
+        main_pkg_dir,
+        tests_dir,
+        www_dir,
+        www_dir / "src",
+        www_dir / "theme",
+        www_dir / "theme" / "overrides",
+    ]
+    if not no_github:
+        directories.extend([gh_workflows_dir.parent, gh_workflows_dir])
+    for directory in directories:
+        vmkdir(project_path / directory)
+
+    if not no_github:
         max_py_minor_version = int(config[ConfigKey.max_py_version].split(".")[1])
         py_minor_versions = range(min_py_minor_version, max_py_minor_version + 1)
         py_version_strs = [
@@ -756,71 +1102,25 @@ def init_project(config: dict[ConfigKey, Any]):
             )
         )
 
-        gh_workflows_dir = project_path / ".github" / "workflows"
-        vprint(f"+ MKDIR {gh_workflows_dir}", file=sys.stderr)
-        gh_workflows_dir.mkdir(parents=True)
-
-        for fname, fdata in [
-            ("check-pr.yml", CHECK_PR_WORKFLOW),
-            ("release-new-version.yml", RELEASE_NEW_VERSION_WORKFLOW),
-            ("create-github-release.yml", CREATE_GITHUB_RELEASE_WORKFLOW),
-            ("publish-to-pypi.yml", PUBLISH_TO_PYPI_WORKFLOW),
-            ("deploy-project-site.yml", DEPLOY_PROJECT_SITE_WORKFLOW),
-            ("run-tests.yml", run_tests_workflow),
-            ("update-pre-commit-hooks.yml", update_pc_hooks_workflow),
-        ]:
-            vwritetext(gh_workflows_dir / fname, fdata)
-
-    scripts_dir = Path("scripts")
-    main_pkg_dir = Path("src") / config[ConfigKey.main_pkg]
-    tests_dir = Path("tests")
-    www_dir = Path("www")
-
-    for directory in [
-        scripts_dir,
-        main_pkg_dir,
-        tests_dir,
-        www_dir / "src",
-        www_dir / "theme" / "overrides",
-    ]:
-        vprint(f"+ MKDIR {project_path / directory}", file=sys.stderr)
-        (project_path / directory).mkdir(parents=True)
-
-    script_files_data = [
-        (scripts_dir / "gen_site_usage_pages.py", GEN_SITE_USAGE_PAGES_SCRIPT),
-        (scripts_dir / "make_docs.py", MAKE_DOCS_SCRIPT),
-    ]
-    if config[ConfigKey.no_github]:
-        script_files_data.append(
-            (scripts_dir / "release_new_version.py", RELEASE_NEW_VERSION_SCRIPT)
+        vwritetext(
+            project_path / gh_workflows_dir / "run-tests.yml", run_tests_workflow
         )
-    else:
-        script_files_data.extend(
-            [
-                (
-                    scripts_dir / "commit_and_tag_version.py",
-                    COMMIT_AND_TAG_VERSION_SCRIPT,
-                ),
-                (scripts_dir / "verify_pr_commits.py", VERIFY_PR_COMMITS_SCRIPT),
-            ]
+        vwritetext(
+            project_path / gh_workflows_dir / "update-pre-commit-hooks.yml",
+            update_pc_hooks_workflow,
         )
 
-    for fpath, fdata in [
-        ("README.md", readme),
-        (".commitlintrc.yaml", COMMITLINT_RC),
-        (".cspell.json", CSPELL_CONFIG),
-        (".editorconfig", EDITORCONFIG),
-        (".gitattributes", GITATTRIBUTES),
-        (".gitignore", GITIGNORE),
-        (".pre-commit-config.yaml", pre_commit_config),
-        (".prettierignore", PRETTIER_IGNORE),
-        (".prettierrc.js", PRETTIER_RC),
-        *script_files_data,
-        (main_pkg_dir / "__init__.py", INIT_PY),
-        (main_pkg_dir / "_version.py", VERSION_PY),
-        (www_dir / "theme" / "overrides" / "main.html", THEME_OVERRIDE_MAIN),
-    ]:
-        vwritetext(project_path / fpath, fdata)
+    vwritetext(project_path / main_pkg_dir / "__init__.py", INIT_PY)
+    vwritetext(project_path / main_pkg_dir / "_version.py", VERSION_PY)
+    github_project_files = (
+        NO_GITHUB_PROJECT_FILES if no_github else GITHUB_PROJECT_FILES
+    )
+    for fpath, fdata in chain(PROJECT_FILES, github_project_files):
+        vwritebytes(project_path / fpath, fdata)
+        # Scripts are made executable right after they are written.
+        if Path(fpath).parent == scripts_dir:
+            vprint(f"+ CHMOD+x {project_path / fpath}", file=sys.stderr)
+            os.chmod(project_path / fpath, SCRIPT_FILE_MODE)
 
     vtouch(project_path / "project-words.txt")
     vtouch(project_path / "CHANGELOG.md")
@@ -829,9 +1129,7 @@ def init_project(config: dict[ConfigKey, Any]):
     vtouch(project_path / "tests" / "__init__.py")
 
     if not config[ConfigKey.no_doctests]:
-        test_doctests_py = TEST_DOCTESTS_TEMPLATE.format(
-            main_pkg=config[ConfigKey.main_pkg]
-        )
+        test_doctests_py = TEST_DOCTESTS_TEMPLATE.format(main_pkg=main_pkg)
         vwritetext(project_path / "tests" / "test_doctests.py", test_doctests_py)
 
     web_src_dir = project_path / "www" / "src"
@@ -843,13 +1141,6 @@ def init_project(config: dict[ConfigKey, Any]):
         vprint(f"+ SYMLINK {web_src_dir / link_tgt} -> {link_src}", file=sys.stderr)
         os.symlink(Path("..") / ".." / link_src, web_src_dir / link_tgt)
 
-    for script_path in (project_path / scripts_dir).glob("*"):
-        vprint(f"+ CHMOD+x {script_path}", file=sys.stderr)
-        os.chmod(
-            script_path,
-            stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH,
-        )
-
 
 ########################################################################
 # FUNCTION TO INSTALL AND SETUP NEW PROJECT
@@ -857,8 +1148,15 @@ def init_project(config: dict[ConfigKey, Any]):
 # create an initial commit.
 
 
+def split_deps(deps: str) -> list[str]:
+    # Dependencies are given as a ';' separated string, which can have
+    # whitespace around each dependency, and empty entries.
+    return [dep for dep_raw in deps.split(";") if (dep := dep_raw.strip())]
+
+
 def create_project(config: dict[ConfigKey, Any]):
     project_path = Path(config[ConfigKey.project])
+    barebones = config[ConfigKey.barebones]
     scripts_dir = Path("scripts")
 
     vprint(file=sys.stderr)
@@ -867,22 +1165,20 @@ def create_project(config: dict[ConfigKey, Any]):
 
     vrun(["git", "init", "-b", "master"])
 
-    vrun(["poetry", "install", "--all-extras"])
+    # Dependencies are added with `--lock`, which only updates the lock
+    # file, and are then installed together with a single call to
+    # `poetry install`.
     dev_dependencies = ["pre-commit", "ruff", "mypy"]
-    if not config[ConfigKey.barebones]:
+    if not barebones:
         dev_dependencies.extend(
             ["sphinx", "git+https://github.com/liran-funaro/sphinx-markdown-builder"]
         )
-    add_dev_deps = [
-        dep
-        for dep_raw in config[ConfigKey.add_dev_deps].split(";")
-        if (dep := dep_raw.strip())
-    ]
+    add_dev_deps = split_deps(config[ConfigKey.add_dev_deps])
     if add_dev_deps:
         dev_dependencies.extend(add_dev_deps)
-    vrun(["poetry", "add", "--group", "dev", *dev_dependencies])
+    vrun(["poetry", "add", "--lock", "--group", "dev", *dev_dependencies])
 
-    if not config[ConfigKey.barebones]:
+    if not barebones:
         site_deps = [
             "mkdocstrings[python-legacy]",
             "mkdocs-material",
@@ -890,44 +1186,63 @@ def create_project(config: dict[ConfigKey, Any]):
             "mkdocs-literate-nav",
             "git+https://github.com/jimporter/mike",
         ]
-        vrun(["poetry", "add", "--group", "site", *site_deps])
+        vrun(["poetry", "add", "--lock", "--group", "site", *site_deps])
 
-    add_deps = [
-        dep
-        for dep_raw in config[ConfigKey.add_deps].split(";")
-        if (dep := dep_raw.strip())
-    ]
+    add_deps = split_deps(config[ConfigKey.add_deps])
     if add_deps:
-        vrun(["poetry", "add", *add_deps])
-
-    vrun(["poetry", "run", "pre-commit", "install"])
-    vrun(["poetry", "run", "pre-commit", "autoupdate"])
-
-    if not config[ConfigKey.barebones]:
-        vrun(
-            [
-                "poetry",
-                "run",
-                "pre-commit",
-                "run",
-                "prettier",
-                "--files",
-                "pyproject.toml",
-                "mkdocs.yml",
-                "LICENSE.md",
-                "README.md",
-            ],
-            check=False,
-        )
-        vrun(["poetry", "run", "python", str(scripts_dir / "make_docs.py")])
-        vrun(["poetry", "run", "mkdocs", "build"])
+        vrun(["poetry", "add", "--lock", *add_deps])
+
+    vrun(["poetry", "install", "--all-extras"])
+
+    # Only needed here and for setting up GitHub, so imported here to avoid
+    # slowing down startup.
+    from concurrent.futures import ThreadPoolExecutor
+
+    make_docs_cmd = ["poetry", "run", "python", str(scripts_dir / "make_docs.py")]
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Docs are generated in the background, since they do not depend
+        # on the pre-commit steps below. The command is run directly
+        # instead of with `vrun`, so that nothing is printed from the
+        # background thread. The command and its output are shown together
+        # once it completes (with output only shown on failure if not
+        # verbose, same as `vrun`).
+        make_docs_future: Optional[Future[CompletedProcess]] = None
+        if not barebones:
+            make_docs_future = executor.submit(
+                subprocess.run, make_docs_cmd, capture_output=True, text=True
+            )
+
+        vrun(["poetry", "run", "pre-commit", "install"])
+        vrun(["poetry", "run", "pre-commit", "autoupdate"])
+
+        if make_docs_future is not None:
+            vrun(
+                [
+                    "poetry",
+                    "run",
+                    "pre-commit",
+                    "run",
+                    "prettier",
+                    "--files",
+                    "pyproject.toml",
+                    "mkdocs.yml",
+                    "LICENSE.md",
+                    "README.md",
+                ],
+                check=False,
+            )
+            make_docs_pdone = make_docs_future.result()
+            vprint(f"\n+ RUN {shlex.join(make_docs_cmd)}", file=sys.stderr)
+            if verbose or make_docs_pdone.returncode != 0:
+                print(make_docs_pdone.stdout, end="")
+                print(make_docs_pdone.stderr, end="", file=sys.stderr)
+            make_docs_pdone.check_returncode()
+            vrun(["poetry", "run", "mkdocs", "build"])
 
     vrun(["git", "add", "."])
     env = os.environ.copy()
     env["SKIP"] = "cspell"
-    commit_msg = (
-        "Initial commit" if config[ConfigKey.barebones] else "chore: initial commit"
-    )
+    commit_msg = "Initial commit" if barebones else "chore: initial commit"
     vrun(["git", "commit", "-m", commit_msg], env=env)
 
     vprint(f"\nsuccessfully initialized project at {project_path}", file=sys.stderr)
@@ -941,20 +1256,82 @@ def create_project(config: dict[ConfigKey, Any]):
 # so fully scripted GitHub setup is not possible any way.
 
 
-def setup_github(config: dict[ConfigKey, Any]):
-    api_access_token = getpass(
-        "enter personal access token for github api "
-        "(with 'administration:write' and 'secrets:write' permissions): "
+def uncomment_setting(path: Path, comment_prefix: str, setting: str):
+    # Replaces the line with a commented out setting (starting with
+    # `comment_prefix`, like '# repository = ') by `setting`. The file is
+    # patched as bytes, without parsing it.
+    vprint(f"\n+ UPDATE {path}", file=sys.stderr)
+    data = path.read_bytes()
+    start = data.find(comment_prefix.encode("utf-8"))
+    if start == -1:
+        return
+    end = data.find(b"\n", start)
+    if end == -1:
+        end = len(data)
+    path.write_bytes(data[:start] + setting.encode("utf-8") + data[end:])
+
+
+class GitHubSetupInputs(NamedTuple):
+    api_access_token: str
+    git_use_ssh: bool
+    release_token: str
+    pypi_access_token: str
+    uninstall_encryption_deps: bool
+
+
+def get_github_setup_inputs(config: dict[ConfigKey, Any]) -> GitHubSetupInputs:
+    # Inputs are read before the project is created, so that the slow
+    # project creation steps can run unattended. `getpass` is only needed
+    # here, so it is imported here to avoid slowing down startup.
+    from getpass import getpass
+
+    project_name = Path(config[ConfigKey.project]).stem
+    try:
+        api_access_token = getpass(
+            "enter personal access token for github api "
+            "(with 'administration:write' and 'secrets:write' permissions): "
+        )
+        git_use_ssh = get_yes_no_input(
+            "use ssh for connecting to github (instead of https)", True
+        )
+        release_token = getpass(
+            f"\n[https://github.com/settings/personal-access-tokens/new] "
+            f"create a personal access token with 'contents:write' "
+            f"permission for this project's repo ('{project_name}') "
+            f"and enter it here (or leave empty to skip this step): "
+        )
+        pypi_access_token = getpass(
+            "\nenter token for uploading releases to pypi "
+            "(or leave empty to skip this step): "
+        )
+    except KeyboardInterrupt:
+        sys.exit(1)
+
+    uninstall_encryption_deps = False
+    if (
+        release_token or pypi_access_token
+    ) and not GitHubAPI.SecretsManager.can_import_nacl():
+        uninstall_encryption_deps = get_yes_no_input(
+            "\nuninstall dependencies used for encryption of tokens", False
+        )
+
+    return GitHubSetupInputs(
+        api_access_token,
+        git_use_ssh,
+        release_token,
+        pypi_access_token,
+        uninstall_encryption_deps,
     )
-    gh_api = GitHubAPI(api_access_token)
+
+
+def setup_github(config: dict[ConfigKey, Any], inputs: GitHubSetupInputs):
+    from concurrent.futures import ThreadPoolExecutor
+
+    gh_api = GitHubAPI(inputs.api_access_token)
 
     project_path = Path(config[ConfigKey.project])
     project_name = project_path.stem
 
-    git_use_ssh = get_yes_no_input(
-        "use ssh for connecting to github (instead of https)", True
-    )
-
     repo_creation_response = gh_api.call(
         "user/repos",
         "POST",
@@ -967,92 +1344,83 @@ def setup_github(config: dict[ConfigKey, Any]):
     try:
         repo_owner = repo_creation_response["owner"]["login"]
         repo_url = repo_creation_response["html_url"]
-        repo_origin = repo_creation_response["ssh_url"] if git_use_ssh else repo_url
+        repo_origin = (
+            repo_creation_response["ssh_url"] if inputs.git_use_ssh else repo_url
+        )
     except KeyError:
         raise GitHubAPI.Error(f"response:\n{repo_creation_response}") from None
 
-    vprint("\n+ UPDATE pyproject.toml", file=sys.stderr)
-    with open("pyproject.toml", "r") as f:
-        pyproject_data = f.read()
-    pyproject_data = re.sub(
-        r"# repository = .*", f'repository = "{repo_url}"', pyproject_data, count=1
-    )
-    with open("pyproject.toml", "w") as f:
-        print(pyproject_data, file=f, end="")
-    vrun(["poetry", "lock", "--no-update"])
-
-    vprint("\n+ UPDATE mkdocs.yml", file=sys.stderr)
-    with open("mkdocs.yml", "r") as f:
-        mkdocs_data = f.read()
-    mkdocs_data = re.sub(
-        r"# repo_url: .*", f'repo_url: "{repo_url}"', mkdocs_data, count=1
+    uncomment_setting(
+        Path("pyproject.toml"), "# repository = ", f'repository = "{repo_url}"'
     )
-    with open("mkdocs.yml", "w") as f:
-        print(mkdocs_data, file=f, end="")
+    # The lock file does not need to be updated, since Poetry's content hash
+    # only covers dependency related sections.
+    uncomment_setting(Path("mkdocs.yml"), "# repo_url: ", f'repo_url: "{repo_url}"')
 
-    vrun(["git", "add", "pyproject.toml", "mkdocs.yml"])
-    vrun(["git", "commit", "--amend", "--no-edit"])
+    # Passing paths to `git commit` stages them as part of the commit.
+    vrun(
+        ["git", "commit", "--amend", "--no-edit", "--", "pyproject.toml", "mkdocs.yml"]
+    )
     vrun(["git", "remote", "add", "origin", repo_origin])
     vrun(["git", "push", "-u", "origin", "master"])
-
-    gh_api.call(
-        f"repos/{repo_owner}/{project_name}/branches/master/protection",
-        "PUT",
-        {
-            "required_status_checks": None,
-            "enforce_admins": None,
-            "required_pull_request_reviews": None,
-            "restrictions": None,
-            "required_linear_history": True,
-        },
-    )
-
-    gh_api.call(
-        (
-            f"repos/{repo_owner}/{project_name}/"
-            f"branches/master/protection/required_pull_request_reviews"
-        ),
-        "PATCH",
-        {"required_approving_review_count": 0},
-    )
-
-    gh_api.call(
-        f"repos/{repo_owner}/{project_name}/tags/protection", "POST", {"pattern": "v*"}
-    )
-
-    gh_api.call(
-        f"repos/{repo_owner}/{project_name}/actions/permissions/workflow",
-        "PUT",
-        {
-            "default_workflow_permissions": "read",
-            "can_approve_pull_request_reviews": True,
-        },
-    )
-
-    with gh_api.setup_secrets_manager() as gh_secrets_manager:
-        release_token = getpass(
-            f"\n[https://github.com/settings/personal-access-tokens/new] "
-            f"create a personal access token with 'contents:write' "
-            f"permission for this project's repo ({repo_owner}/{project_name})"
-            f"and enter it here (or leave empty to skip this step): "
-        )
-        if release_token:
-            gh_secrets_manager.upload_actions_secret(
-                repo_owner, project_name, "REPO_PAT", release_token
-            )
-
-        pypi_access_token = getpass(
-            "\nenter token for uploading releases to pypi "
-            "(or leave empty to skip this step): "
-        )
-        if pypi_access_token:
-            gh_secrets_manager.upload_actions_secret(
-                repo_owner, project_name, "PYPI_TOKEN", pypi_access_token
-            )
-
-        gh_secrets_manager.do_uninstall = get_yes_no_input(
-            "\nuninstall dependencies used for encryption of tokens", False
-        )
+    # The repository settings below are independent of each other, so they
+    # are updated concurrently. This is only done after pushing, so that
+    # output from the calls is not mixed with output from `git push`, and
+    # because branch protection needs the branch to exist on GitHub. Pull
+    # request review settings are included in the protection update, so
+    # they don't need a separate request.
+    with ThreadPoolExecutor() as executor:
+        settings_futures = [
+            executor.submit(
+                gh_api.call,
+                f"repos/{repo_owner}/{project_name}/tags/protection",
+                "POST",
+                {"pattern": "v*"},
+            ),
+            executor.submit(
+                gh_api.call,
+                f"repos/{repo_owner}/{project_name}/actions/permissions/workflow",
+                "PUT",
+                {
+                    "default_workflow_permissions": "read",
+                    "can_approve_pull_request_reviews": True,
+                },
+            ),
+            executor.submit(
+                gh_api.call,
+                f"repos/{repo_owner}/{project_name}/branches/master/protection",
+                "PUT",
+                {
+                    "required_status_checks": None,
+                    "enforce_admins": None,
+                    "required_pull_request_reviews": {
+                        "required_approving_review_count": 0
+                    },
+                    "restrictions": None,
+                    "required_linear_history": True,
+                },
+            ),
+        ]
+    for settings_future in settings_futures:
+        settings_future.result()
+
+    # Secrets are only uploaded if provided, so encryption dependencies are
+    # not installed if there is nothing to encrypt.
+    secrets = [
+        (secret_name, secret)
+        for secret_name, secret in [
+            ("REPO_PAT", inputs.release_token),
+            ("PYPI_TOKEN", inputs.pypi_access_token),
+        ]
+        if secret
+    ]
+    if secrets:
+        with gh_api.setup_secrets_manager() as gh_secrets_manager:
+            gh_secrets_manager.do_uninstall = inputs.uninstall_encryption_deps
+            for secret_name, secret in secrets:
+                gh_secrets_manager.upload_actions_secret(
+                    repo_owner, project_name, secret_name, secret
+                )
 
     vprint("\nsuccessfully configured github for project", file=sys.stderr)
 
@@ -1063,26 +1431,26 @@ def setup_github(config: dict[ConfigKey, Any]):
 
 def main():
     config_mode, config = get_conf()
+
+    github_setup_inputs: Optional[GitHubSetupInputs] = None
+    if not (
+        config_mode == ConfigMode.non_interactive
+        or config[ConfigKey.barebones]
+        or config[ConfigKey.no_github]
+    ):
+        do_setup_github = get_yes_no_input(
+            "\ncreate and configure github repository for project", default=True
+        )
+        if do_setup_github:
+            github_setup_inputs = get_github_setup_inputs(config)
     project_created = False
 
     try:
         init_project(config)
         create_project(config)
         project_created = True
-        if (
-            config_mode == ConfigMode.non_interactive
-            or config[ConfigKey.barebones]
-            or config[ConfigKey.no_github]
-        ):
-            return
-
-        do_setup_github = get_yes_no_input(
-            "\ncreate and configure github repository for project", default=True
-        )
-        if not do_setup_github:
-            return
-
-        setup_github(config)
+        if github_setup_inputs is not None:
+            setup_github(config, github_setup_inputs)
 
     except (KeyboardInterrupt, OSError, CalledProcessError, GitHubAPI.Error) as e:
         print(e, file=sys.stderr)
@@ -1093,6 +1461,8 @@ def main():
                 f"clean project folder '{config[ConfigKey.project]}'", default=True
             )
             if do_clean:
+                import shutil
+
                 try:
                     os.chdir(pwd_abs)
                     shutil.rmtree(config[ConfigKey.project])
@@ -1930,6 +2300,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+TRAILING_SPACES_REGEX = re.compile(r" +$", flags=re.MULTILINE)
+
 docs_dir = Path("docs")
 build_dir = docs_dir / "_build"
 src_dir = Path("src")
@@ -1971,16 +2343,16 @@ build_cmd = [
 print(f"+ {shlex.join(build_cmd)}", file=sys.stderr)
 subprocess.run(build_cmd, check=True, text=True)
 
-# Remove tralining spaces and newlines from the generated files.
+# Remove tralining spaces and newlines from the generated files. Files are
+# processed in text mode, so that line endings are handled on all
+# platforms, and only written back if they change.
 for fname in docs_dir.glob("**/*.md"):
-    with open(fname, "r") as f:
-        fdata = f.read()
-
-    fdata_fixed = re.sub(r" *(?=$)", "", fdata, flags=re.MULTILINE)
-    fdata_fixed = re.sub("\n+(?=$)", "", fdata_fixed)
+    fdata = fname.read_text()
+    if not fdata:
+        continue
+    fdata_fixed = TRAILING_SPACES_REGEX.sub("", fdata).rstrip("\n") + "\n"
     if fdata_fixed != fdata:
-        with open(fname, "w") as f:
-            print(fdata_fixed, file=f)
+        fname.write_text(fdata_fixed)
 
 """
 
@@ -2010,10 +2382,22 @@ commit_msgs = [
     for commit in commits
 ]
 
+# The project's Python executable is found once, so Poetry does not need to
+# be started for every commit.
+poetry_env_cmd = ["poetry", "env", "info", "--executable"]
+try:
+    poetry_env_proc = subprocess.run(
+        poetry_env_cmd, check=True, capture_output=True, text=True
+    )
+except subprocess.CalledProcessError as e:
+    print(e.stderr, file=sys.stderr)
+    sys.exit(e.returncode)
+python_executable = poetry_env_proc.stdout.strip()
+
 pre_commit_cmd = [
-    "poetry",
-    "run",
-    "pre-commit",
+    python_executable,
+    "-m",
+    "pre_commit",
     "run",
     "--hook-stage",
     "manual",
@@ -2192,6 +2576,59 @@ def load_tests(loader, tests, ignore):
 """
 
 
+########################################################################
+# STATIC PROJECT FILES
+# These files are written as-is (without formatting) to new projects.
+# Paths are relative to the project directory. File data is encoded once
+# when the script is loaded.
+
+
+def encode_project_files(files: list[tuple[str, str]]) -> tuple[tuple[str, bytes], ...]:
+    return tuple((fpath, encode_file_text(fdata)) for fpath, fdata in files)
+
+
+BAREBONES_PROJECT_FILES = encode_project_files(
+    [
+        (".cspell.json", CSPELL_CONFIG),
+        (".editorconfig", EDITORCONFIG),
+        (".gitignore", GITIGNORE),
+        (".pre-commit-config.yaml", PRE_COMMIT_CONFIG_SIMPLE),
+    ]
+)
+
+PROJECT_FILES = encode_project_files(
+    [
+        (".commitlintrc.yaml", COMMITLINT_RC),
+        (".cspell.json", CSPELL_CONFIG),
+        (".editorconfig", EDITORCONFIG),
+        (".gitattributes", GITATTRIBUTES),
+        (".gitignore", GITIGNORE),
+        (".pre-commit-config.yaml", PRE_COMMIT_CONFIG),
+        (".prettierignore", PRETTIER_IGNORE),
+        (".prettierrc.js", PRETTIER_RC),
+        ("scripts/gen_site_usage_pages.py", GEN_SITE_USAGE_PAGES_SCRIPT),
+        ("scripts/make_docs.py", MAKE_DOCS_SCRIPT),
+        ("www/theme/overrides/main.html", THEME_OVERRIDE_MAIN),
+    ]
+)
+
+GITHUB_PROJECT_FILES = encode_project_files(
+    [
+        (".github/workflows/check-pr.yml", CHECK_PR_WORKFLOW),
+        (".github/workflows/release-new-version.yml", RELEASE_NEW_VERSION_WORKFLOW),
+        (".github/workflows/create-github-release.yml", CREATE_GITHUB_RELEASE_WORKFLOW),
+        (".github/workflows/publish-to-pypi.yml", PUBLISH_TO_PYPI_WORKFLOW),
+        (".github/workflows/deploy-project-site.yml", DEPLOY_PROJECT_SITE_WORKFLOW),
+        ("scripts/commit_and_tag_version.py", COMMIT_AND_TAG_VERSION_SCRIPT),
+        ("scripts/verify_pr_commits.py", VERIFY_PR_COMMITS_SCRIPT),
+    ]
+)
+
+NO_GITHUB_PROJECT_FILES = encode_project_files(
+    [("scripts/release_new_version.py", RELEASE_NEW_VERSION_SCRIPT)]
+)
+
+
 ########################################################################
 # ENTRY POINT
 
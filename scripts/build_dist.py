@@ -2,9 +2,14 @@
 # This script populates the placeholders in the source with data, and
 # generates `dist/pyseed.py`.
 
+import re
 import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Placeholders are in the form '!!!<FILENAME>!!!'.
+PLACEHOLDER_REGEX = re.compile(r"!!!([\w.-]+)!!!")
+
 src_dir = Path("src")
 src_pyseed_path = src_dir / "pyseed.py"
 data_dir = src_dir / "data"
@@ -13,19 +18,41 @@ dist_pyseed_path = dist_dir / "pyseed.py"
 
 pyseed_data = src_pyseed_path.read_text()
 
-for data_file in data_dir.glob("*"):
-    data = data_file.read_text()
-    # Placeholders are in the form '!!!<FILENAME>!!!'.
-    pyseed_data_sub = pyseed_data.replace(f"!!!{data_file.name}!!!", data)
-    if pyseed_data_sub == pyseed_data:
-        raise AssertionError(f"no placeholder found for {data_file}")
-    pyseed_data = pyseed_data_sub
+# Data files are read concurrently.
+data_files = list(data_dir.glob("*"))
+with ThreadPoolExecutor(max_workers=8) as executor:
+    data_map = dict(
+        zip(
+            (data_file.name for data_file in data_files),
+            executor.map(Path.read_text, data_files),
+        )
+    )
 
-# Add shebang.
-pyseed_data = "#!/usr/bin/env python3\n\n" + pyseed_data
+# Placeholders are validated before anything is written, so a partial
+# file is never generated.
+placeholder_matches = list(PLACEHOLDER_REGEX.finditer(pyseed_data))
+used_data_files = set()
+for match in placeholder_matches:
+    if match.group(1) not in data_map:
+        raise AssertionError(f"no data file for placeholder '{match.group(0)}'")
+    used_data_files.add(match.group(1))
+unused_data_files = sorted(data_map.keys() - used_data_files)
+if unused_data_files:
+    raise AssertionError(f"no placeholder found for {data_dir / unused_data_files[0]}")
 
+# The source is written in chunks, with data in place of placeholders,
+# instead of building the full output in memory.
 dist_dir.mkdir(exist_ok=True)
-dist_pyseed_path.write_text(pyseed_data)
+with dist_pyseed_path.open("w") as f:
+    # Add shebang.
+    f.write("#!/usr/bin/env python3\n\n")
+    last_end = 0
+    for match in placeholder_matches:
+        f.write(pyseed_data[last_end : match.start()])
+        f.write(data_map[match.group(1)])
+        last_end = match.end()
+    f.write(pyseed_data[last_end:])
+
 dist_pyseed_path_mode = dist_pyseed_path.stat().st_mode
 dist_pyseed_path.chmod(
     dist_pyseed_path_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
@@ -6,6 +6,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+TRAILING_SPACES_REGEX = re.compile(r" +$", flags=re.MULTILINE)
+
 docs_dir = Path("docs")
 build_dir = docs_dir / "_build"
 src_dir = Path("src")
@@ -47,13 +49,13 @@ build_cmd = [
 print(f"+ {shlex.join(build_cmd)}", file=sys.stderr)
 subprocess.run(build_cmd, check=True, text=True)
 
-# Remove tralining spaces and newlines from the generated files.
+# Remove tralining spaces and newlines from the generated files. Files are
+# processed in text mode, so that line endings are handled on all
+# platforms, and only written back if they change.
 for fname in docs_dir.glob("**/*.md"):
-    with open(fname, "r") as f:
-        fdata = f.read()
-
-    fdata_fixed = re.sub(r" *(?=$)", "", fdata, flags=re.MULTILINE)
-    fdata_fixed = re.sub("\n+(?=$)", "", fdata_fixed)
+    fdata = fname.read_text()
+    if not fdata:
+        continue
+    fdata_fixed = TRAILING_SPACES_REGEX.sub("", fdata).rstrip("\n") + "\n"
     if fdata_fixed != fdata:
-        with open(fname, "w") as f:
-            print(fdata_fixed, file=f)
+        fname.write_text(fdata_fixed)
@@ -24,10 +24,22 @@ commit_msgs = [
     for commit in commits
 ]
 
+# The project's Python executable is found once, so Poetry does not need to
+# be started for every commit.
+poetry_env_cmd = ["poetry", "env", "info", "--executable"]
+try:
+    poetry_env_proc = subprocess.run(
+        poetry_env_cmd, check=True, capture_output=True, text=True
+    )
+except subprocess.CalledProcessError as e:
+    print(e.stderr, file=sys.stderr)
+    sys.exit(e.returncode)
+python_executable = poetry_env_proc.stdout.strip()
+
 pre_commit_cmd = [
-    "poetry",
-    "run",
-    "pre-commit",
+    python_executable,
+    "-m",
+    "pre_commit",
     "run",
     "--hook-stage",
     "manual",